@@ -0,0 +1,141 @@
+"""Pruebas de rendimiento reproducibles para PONG y FALL BLOCKS.
+
+Cada escenario usa una semilla fija y el driver de vídeo "dummy" de SDL (sin ventana
+real, pero con el mismo dibujo), mide cada frame con ``FrameProfiler`` sin esperar al
+reloj y muestra FPS y los percentiles 50 y 99 del tiempo por frame. Con --json se
+guardan los informes completos para comparar entre versiones:
+
+    python benchmark.py --frames 1200 --json bench.json
+"""
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"  # Antes de importar pygame
+
+import argparse
+import json
+import platform
+import random
+
+import pygame
+
+from launcher import load_game
+from profiler import FrameProfiler
+
+BALLS_IN_FLIGHT = 500
+BLOCK_ROWS = 20
+EXTREME_BALL_SPEED = 2000
+
+
+def measure(game, frames, warmup, prepare=None):
+    """Mide frames frames de la partida (eventos, lógica y dibujo) tras warmup de calentamiento.
+
+    Cada frame avanza exactamente un paso de lógica. prepare(frame) prepara el escenario
+    antes de cada frame.
+    """
+    scheduler = game.scheduler
+    profiler = scheduler.profiler = FrameProfiler(window=None)
+    scheduler.switch("play")
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            profiler.reset()
+        if prepare is not None:
+            prepare(frame)
+        profiler.start_frame()
+        game.tick(scheduler.step_ms)
+        profiler.end_frame(**game.frame_counts())
+    return profiler.report()
+
+
+# --- ESCENARIOS ---
+def falling_balls(fall_blocks, frames, warmup, seed, vectorized):
+    """FALL BLOCKS con 500 bolas en vuelo todo el tiempo contra bloques indestructibles."""
+    game = fall_blocks.Game(seed=seed, vectorized=vectorized, history=False)
+    game.ai_sides = set()  # Nadie dispara: las bolas las repone el escenario
+    game.resistance_range = (10 ** 6, 10 ** 6)
+    game.reset_game(seed)
+    rng = random.Random(seed)
+
+    def refill(frame):
+        while len(game.balls) < BALLS_IN_FLIGHT:
+            game.balls.add(fall_blocks.Ball(rng.randint(60, fall_blocks.WIDTH - 60), rng.randint(150, 540)))
+
+    return measure(game, frames, warmup, refill)
+
+
+def tall_board(fall_blocks, frames, warmup, seed, vectorized):
+    """FALL BLOCKS IA contra IA con 20 filas de bloques (las de arriba, aún fuera de pantalla)."""
+    game = fall_blocks.Game(seed=seed, vectorized=vectorized, history=False)
+    game.ai_sides = {"IA", "Player"}
+    game.turn_pause = 0
+    game.planner.budget_ms = None  # Como sin ventana: la IA no depende de lo rápida que sea la CPU
+
+    def stack(frame):
+        if frame and game.scheduler.name == "play":
+            return
+        game.reset_game(seed)  # Al principio y cada vez que termina la partida
+        game.blocks.empty()
+        game.index.clear()
+        game.planner.reset()
+        for row in range(BLOCK_ROWS):  # La fila más baja queda donde siempre; el resto, encima
+            for col in range(20):
+                block = fall_blocks.Block(50 + col * 35, 85 - row * 35, game.rng.randint(*game.resistance_range))
+                game.blocks.add(block)
+                game.index.add(block)
+        game.scheduler.switch("play")
+
+    return measure(game, frames, warmup, stack)
+
+
+def extreme_pong(pong, frames, warmup, seed):
+    """PONG con la pelota a 2000 px por frame y la pala del jugador siempre a su altura."""
+    game = pong.Pong(seed=seed, history=False)
+    game.goal_pause = 0
+    game.winning_score = 10 ** 9
+
+    def follow(frame):
+        game.ball_speed = max(game.ball_speed, EXTREME_BALL_SPEED)
+        top = int(game.ball_y) - game.paddle_height // 2
+        game.player_y = min(max(top, 0), pong.HEIGHT - game.paddle_height)
+
+    return measure(game, frames, warmup, follow)
+
+
+def run(frames=1200, warmup=120, seed=0, vectorized=False, only=None):
+    """Ejecuta los escenarios y devuelve sus informes por nombre."""
+    fall_blocks = load_game("fall_blocks", "FALL_BLOCKS.PY")
+    pong = load_game("pong", "PONG.PY")
+    scenarios = {
+        "fall_blocks_500_balls": lambda: falling_balls(fall_blocks, frames, warmup, seed, vectorized),
+        "fall_blocks_20_rows": lambda: tall_board(fall_blocks, frames, warmup, seed, vectorized),
+        "pong_extreme_speed": lambda: extreme_pong(pong, frames, warmup, seed),
+    }
+    return {name: scenario() for name, scenario in scenarios.items() if only is None or name in only}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pruebas de rendimiento de ARCADE")
+    parser.add_argument("--frames", type=int, default=1200, help="frames medidos por escenario")
+    parser.add_argument("--warmup", type=int, default=120, help="frames de calentamiento sin medir")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de los escenarios")
+    parser.add_argument("--vectorized", action="store_true", help="usar el motor de físicas con NumPy en FALL BLOCKS")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="ejecutar solo estos escenarios")
+    parser.add_argument("--json", metavar="FILE", help="guardar los informes completos en FILE")
+    args = parser.parse_args()
+
+    reports = run(args.frames, args.warmup, args.seed, args.vectorized, args.only)
+    for name, report in reports.items():
+        frame = report["frame_ms"]
+        print(f"{name}: {report['fps']:.0f} fps, p50 {frame['p50']:.2f} ms, p99 {frame['p99']:.2f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "platform": platform.platform(),
+                "frames": args.frames,
+                "seed": args.seed,
+                "vectorized": args.vectorized,
+                "scenarios": reports,
+            }, file, indent=2)
+    pygame.quit()
@@ -0,0 +1,314 @@
+"""Motor de físicas vectorizado (struct-of-arrays) para FALL BLOCKS.
+
+Sustituye a los grupos de sprites de bolas, bloques y power-ups por arreglos de
+NumPy. Cada contenedor imita la parte de ``pygame.sprite.Group`` que usa el juego
+(``add``, ``update``, ``draw``, ``empty``, ``len`` e iteración), así que ``Game``
+solo cambia en los puntos calientes: colisiones y desplazamiento de filas.
+"""
+import numpy as np
+import pygame
+
+from render import solid_surface
+
+BALL_SIZE = 7
+BLOCK_SIZE = 30
+POWERUP_SIZE = 20
+CELL_SIZE = 40  # Celda de la rejilla: mayor que un bloque ampliado por el tamaño de la bola
+GRID_STRIDE = 4096  # Separación entre columnas al codificar (columna, fila) en una sola clave
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+
+
+# --- VISTAS ---
+class BlockView:
+    """Copia de solo lectura de un bloque, con la interfaz que usan la IA y el dibujo."""
+
+    def __init__(self, block_id, x, y, resistance, image):
+        self.id = block_id
+        self.rect = pygame.Rect(x, y, BLOCK_SIZE, BLOCK_SIZE)
+        self.resistance = resistance
+        self.image = image
+
+    def __eq__(self, other):
+        return isinstance(other, BlockView) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def draw(self, renderer):
+        """Dibuja el bloque con su resistencia en el centro."""
+        renderer.blit(self, self.image, self.rect)
+        renderer.text((self, "resistance"), str(self.resistance), 20, BLACK, center=self.rect.center)
+
+
+class BallView:
+    """Copia de solo lectura de una bola."""
+
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, BALL_SIZE, BALL_SIZE)
+
+
+class PowerUpView:
+    """Copia de solo lectura de un power-up."""
+
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, POWERUP_SIZE, POWERUP_SIZE)
+
+
+# --- CONTENEDORES ---
+class BallArray:
+    """Bolas en vuelo como arreglos de posición (esquina superior izquierda) y velocidad."""
+
+    def __init__(self):
+        self.empty()
+
+    def empty(self):
+        self.x = np.zeros(0, dtype=np.int32)
+        self.y = np.zeros(0, dtype=np.int32)
+        self.vy = np.zeros(0, dtype=np.int32)
+
+    def add(self, ball):
+        """Añade una bola a partir de un sprite ``Ball``."""
+        self.x = np.append(self.x, np.int32(ball.rect.x))
+        self.y = np.append(self.y, np.int32(ball.rect.y))
+        self.vy = np.append(self.vy, np.int32(ball.speed_y))
+
+    def keep(self, mask):
+        """Conserva solo las bolas marcadas en ``mask``."""
+        self.x = self.x[mask]
+        self.y = self.y[mask]
+        self.vy = self.vy[mask]
+
+    def update(self):
+        """Mueve todas las bolas y elimina las que salen por arriba."""
+        self.y += self.vy
+        if len(self) and (self.y + BALL_SIZE < 0).any():
+            self.keep(self.y + BALL_SIZE >= 0)
+
+    def draw(self, renderer):
+        image = solid_surface((BALL_SIZE, BALL_SIZE), WHITE)
+        for i, (x, y) in enumerate(zip(self.x.tolist(), self.y.tolist())):
+            renderer.blit(("ball", i), image, (x, y))
+
+    def __iter__(self):
+        for x, y in zip(self.x.tolist(), self.y.tolist()):
+            yield BallView(x, y)
+
+    def __len__(self):
+        return len(self.x)
+
+    def __bool__(self):
+        return len(self) > 0
+
+
+class BlockArray:
+    """Bloques como arreglos de posición, resistencia y color, en orden de inserción."""
+
+    def __init__(self):
+        self.images = []  # Una superficie por color distinto
+        self.colors = {}
+        self.empty()
+
+    def empty(self):
+        self.id = np.zeros(0, dtype=np.int64)
+        self.x = np.zeros(0, dtype=np.int32)
+        self.y = np.zeros(0, dtype=np.int32)
+        self.resistance = np.zeros(0, dtype=np.int32)
+        self.color = np.zeros(0, dtype=np.int32)
+        self.dirty = True  # La rejilla de colisiones debe reconstruirse
+
+    def add(self, block):
+        """Añade un bloque a partir de un sprite ``Block``."""
+        color = tuple(block.image.get_at((0, 0)))
+        if color not in self.colors:
+            self.colors[color] = len(self.images)
+            self.images.append(block.image.copy())
+
+        self.id = np.append(self.id, block.id)
+        self.x = np.append(self.x, np.int32(block.rect.x))
+        self.y = np.append(self.y, np.int32(block.rect.y))
+        self.resistance = np.append(self.resistance, np.int32(block.resistance))
+        self.color = np.append(self.color, np.int32(self.colors[color]))
+        self.dirty = True
+
+    def keep(self, mask):
+        """Conserva solo los bloques marcados en ``mask``."""
+        self.id = self.id[mask]
+        self.x = self.x[mask]
+        self.y = self.y[mask]
+        self.resistance = self.resistance[mask]
+        self.color = self.color[mask]
+        self.dirty = True
+
+    def shift(self, dy):
+        """Baja todas las filas ``dy`` píxeles en una sola operación."""
+        self.y += dy
+        self.dirty = True
+
+    def __iter__(self):
+        images = self.images
+        for block_id, x, y, resistance, color in zip(self.id.tolist(), self.x.tolist(), self.y.tolist(),
+                                                     self.resistance.tolist(), self.color.tolist()):
+            yield BlockView(block_id, x, y, resistance, images[color])
+
+    def __len__(self):
+        return len(self.x)
+
+    def __bool__(self):
+        return len(self) > 0
+
+
+class PowerUpArray:
+    """Power-ups como arreglos de posición (esquina superior izquierda)."""
+
+    def __init__(self):
+        self.image = None
+        self.empty()
+
+    def empty(self):
+        self.x = np.zeros(0, dtype=np.int32)
+        self.y = np.zeros(0, dtype=np.int32)
+
+    def add(self, powerup):
+        """Añade un power-up a partir de un sprite ``PowerUp``."""
+        if self.image is None:
+            self.image = powerup.image
+        self.x = np.append(self.x, np.int32(powerup.rect.x))
+        self.y = np.append(self.y, np.int32(powerup.rect.y))
+
+    def keep(self, mask):
+        self.x = self.x[mask]
+        self.y = self.y[mask]
+
+    def shift(self, dy):
+        self.y += dy
+
+    def update(self):
+        """Los power-ups no se mueven por sí solos."""
+
+    def draw(self, renderer):
+        for i, (x, y) in enumerate(zip(self.x.tolist(), self.y.tolist())):
+            renderer.blit(("powerup", i), self.image, (x, y))
+
+    def __iter__(self):
+        for x, y in zip(self.x.tolist(), self.y.tolist()):
+            yield PowerUpView(x, y)
+
+    def __len__(self):
+        return len(self.x)
+
+    def __bool__(self):
+        return len(self) > 0
+
+
+# --- MOTOR ---
+class ArrayEngine:
+    """Agrupa los tres contenedores y resuelve las colisiones por lotes."""
+
+    def __init__(self):
+        self.balls = BallArray()
+        self.blocks = BlockArray()
+        self.powerups = PowerUpArray()
+        self.grid_keys = np.zeros(0, dtype=np.int64)
+        self.grid_owners = np.zeros(0, dtype=np.int64)
+        self.hits = []  # (id, resistancia) de los bloques golpeados en el último frame
+        self.collisions = 0  # Pares bola-bloque y bola-power-up del último frame
+
+    def build_grid(self):
+        """Reparte los bloques en una rejilla uniforme indexada por la celda de la bola.
+
+        Cada bloque se registra en las celdas que puede ocupar la esquina superior
+        izquierda de una bola que lo toque (como mucho 2x2 celdas), así que cada bola
+        solo consulta la celda en la que está.
+        """
+        blocks = self.blocks
+        count = len(blocks)
+        col_lo = (blocks.x - (BALL_SIZE - 1)) // CELL_SIZE
+        col_hi = (blocks.x + (BLOCK_SIZE - 1)) // CELL_SIZE
+        row_lo = (blocks.y - (BALL_SIZE - 1)) // CELL_SIZE
+        row_hi = (blocks.y + (BLOCK_SIZE - 1)) // CELL_SIZE
+
+        cols = np.stack([col_lo, col_hi, col_lo, col_hi]).astype(np.int64)
+        rows = np.stack([row_lo, row_lo, row_hi, row_hi]).astype(np.int64)
+        wide = col_hi != col_lo
+        tall = row_hi != row_lo
+        valid = np.stack([np.ones(count, dtype=bool), wide, tall, wide & tall])
+        owners = np.broadcast_to(np.arange(count), (4, count))
+
+        keys = (cols * GRID_STRIDE + rows)[valid]
+        owners = owners[valid]
+        order = np.argsort(keys, kind="stable")
+        self.grid_keys = keys[order]
+        self.grid_owners = owners[order]
+        blocks.dirty = False
+
+    def ball_block_pairs(self):
+        """Devuelve los pares (bola, bloque) que se solapan en este frame."""
+        balls = self.balls
+        blocks = self.blocks
+        if not balls or not blocks:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        if blocks.dirty:
+            self.build_grid()
+
+        # Fase amplia: candidatos de la misma celda
+        keys = (balls.x // CELL_SIZE).astype(np.int64) * GRID_STRIDE + balls.y // CELL_SIZE
+        lo = np.searchsorted(self.grid_keys, keys, side="left")
+        hi = np.searchsorted(self.grid_keys, keys, side="right")
+        counts = hi - lo
+        total = int(counts.sum())
+        ball_idx = np.repeat(np.arange(len(balls)), counts)
+        starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        block_idx = self.grid_owners[starts + np.arange(total)]
+
+        # Fase estrecha: mismo criterio que Rect.colliderect
+        bx = balls.x[ball_idx]
+        by = balls.y[ball_idx]
+        kx = blocks.x[block_idx]
+        ky = blocks.y[block_idx]
+        hit = ((bx < kx + BLOCK_SIZE) & (bx + BALL_SIZE > kx) &
+               (by < ky + BLOCK_SIZE) & (by + BALL_SIZE > ky))
+        return ball_idx[hit], block_idx[hit]
+
+    def collide(self):
+        """Resuelve bola-bloque y bola-power-up; devuelve (bloques destruidos, power-ups recogidos)."""
+        ball_idx, block_idx = self.ball_block_pairs()
+        kills = 0
+        self.hits = []
+        self.collisions = len(block_idx)
+
+        if len(block_idx):
+            blocks = self.blocks
+            before = blocks.resistance.copy()
+            blocks.resistance -= np.bincount(block_idx, minlength=len(blocks)).astype(np.int32)
+            touched = np.unique(block_idx)
+            self.hits = list(zip(blocks.id[touched].tolist(), blocks.resistance[touched].tolist()))
+            dead = blocks.resistance <= 0
+            kills = int((dead & (before > 0)).sum())
+            if dead.any():
+                blocks.keep(~dead)
+
+            alive = np.ones(len(self.balls), dtype=bool)
+            alive[ball_idx] = False
+            self.balls.keep(alive)
+
+        collected = 0
+        balls = self.balls
+        powerups = self.powerups
+        if balls and powerups:
+            bx = balls.x[:, None]
+            by = balls.y[:, None]
+            hit = ((bx < powerups.x + POWERUP_SIZE) & (bx + BALL_SIZE > powerups.x) &
+                   (by < powerups.y + POWERUP_SIZE) & (by + BALL_SIZE > powerups.y)).any(axis=0)
+            collected = int(hit.sum())
+            self.collisions += collected
+            if collected:
+                powerups.keep(~hit)
+
+        return kills, collected
+
+    def shift_rows(self, block_dy, powerup_dy):
+        """Baja bloques y power-ups un turno."""
+        self.blocks.shift(block_dy)
+        self.powerups.shift(powerup_dy)
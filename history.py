@@ -0,0 +1,192 @@
+"""Historial de partidas compartido por PONG y FALL BLOCKS.
+
+Las partidas se guardan en una base SQLite local. El juego solo encola el registro
+(``record`` no toca el disco); un hilo aparte escribe por lotes, en una transacción
+por lote. Las tablas de totales y rachas se actualizan en la misma transacción, así
+que la pantalla de inicio lee tasas de victoria y rachas sin recorrer el historial.
+"""
+import atexit
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+DEFAULT_PATH = os.environ.get("ARCADE_HISTORY",
+                              os.path.join(os.path.dirname(os.path.abspath(__file__)), "historial.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    player_score INTEGER NOT NULL,
+    ai_score INTEGER NOT NULL,
+    winner TEXT NOT NULL,
+    duration REAL NOT NULL,
+    seed INTEGER
+);
+CREATE INDEX IF NOT EXISTS matches_game_time ON matches (game, timestamp);
+CREATE TABLE IF NOT EXISTS totals (
+    game TEXT NOT NULL,
+    winner TEXT NOT NULL,
+    matches INTEGER NOT NULL,
+    PRIMARY KEY (game, winner)
+);
+CREATE TABLE IF NOT EXISTS streaks (
+    game TEXT PRIMARY KEY,
+    winner TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    best_winner TEXT NOT NULL,
+    best_length INTEGER NOT NULL
+);
+"""
+
+DRAW = ""  # Valor de winner para los empates
+RETRIES = 3  # Intentos por lote si la base está bloqueada (p. ej. por el otro juego)
+
+RESULT_TEXT = {
+    "Player": "Tú ganas ^_~",
+    "IA": "Tú pierdes UwU",
+    DRAW: "Empate X_X",
+}
+
+
+class MatchHistory:
+    """Almacén de partidas con escrituras en segundo plano."""
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=256, timeout=10.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.timeout = timeout  # Segundos de espera si otro proceso tiene la base bloqueada
+        self.queue = queue.Queue()
+        self.closed = False
+
+        # Conexión de lectura del hilo del juego; el hilo de escritura abre la suya
+        self.connection = sqlite3.connect(path, timeout=timeout)
+        self.connection.execute("PRAGMA journal_mode=WAL")  # Leer mientras se escribe
+        self.connection.executescript(SCHEMA)
+
+        self.thread = threading.Thread(target=self._writer, name="history-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    # --- Escritura ---
+    def record(self, game, player_score, ai_score, winner, duration, seed=None, timestamp=None):
+        """Encola una partida; vuelve enseguida. winner es "Player", "IA" o None (empate)."""
+        if self.closed:
+            return
+        self.queue.put((game, time.time() if timestamp is None else timestamp, player_score, ai_score,
+                        winner or DRAW, duration, seed))
+
+    def _writer(self):
+        connection = sqlite3.connect(self.path, timeout=self.timeout)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        while True:
+            item = self.queue.get()
+            batch = [item]
+            # Todo lo que se acumuló mientras se escribía el lote anterior va junto
+            while item is not None and len(batch) < self.batch_size:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            records = [record for record in batch if record is not None]
+            try:
+                if records:
+                    self._commit(connection, records)
+            finally:
+                for _ in batch:  # Aunque falle, flush() no se queda esperando
+                    self.queue.task_done()
+            if None in batch:
+                connection.close()
+                return
+
+    def _commit(self, connection, records):
+        """Escribe un lote en una transacción; si falla, lo reintenta y al final lo descarta."""
+        for attempt in range(1, RETRIES + 1):
+            try:
+                with connection:
+                    self._write(connection, records)
+                return
+            except sqlite3.Error as error:
+                if attempt == RETRIES:
+                    print(f"Historial: se pierden {len(records)} partidas ({error})", file=sys.stderr)
+                else:
+                    time.sleep(0.1 * attempt)
+
+    def _write(self, connection, records):
+        connection.executemany(
+            "INSERT INTO matches (game, timestamp, player_score, ai_score, winner, duration, seed) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)", records)
+        for game, _, _, _, winner, _, _ in records:
+            connection.execute(
+                "INSERT INTO totals (game, winner, matches) VALUES (?, ?, 1) "
+                "ON CONFLICT (game, winner) DO UPDATE SET matches = matches + 1", (game, winner))
+            row = connection.execute(
+                "SELECT winner, length, best_winner, best_length FROM streaks WHERE game = ?", (game,)).fetchone()
+            if row is None:
+                best = (winner, 1) if winner != DRAW else (DRAW, 0)
+                connection.execute("INSERT INTO streaks VALUES (?, ?, 1, ?, ?)", (game, winner) + best)
+                continue
+            length = row[1] + 1 if row[0] == winner else 1
+            best_winner, best_length = (winner, length) if length > row[3] and winner != DRAW else row[2:]
+            connection.execute(
+                "UPDATE streaks SET winner = ?, length = ?, best_winner = ?, best_length = ? WHERE game = ?",
+                (winner, length, best_winner, best_length, game))
+
+    def flush(self):
+        """Espera a que todo lo encolado esté en disco."""
+        self.queue.join()
+
+    def close(self):
+        """Escribe lo pendiente y para el hilo de escritura."""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.thread.join()
+        self.connection.close()
+
+    # --- Consultas (todas por índice o por tablas de resumen) ---
+    def recent(self, game, limit=5):
+        """Últimas partidas de un juego, de la más reciente a la más antigua."""
+        rows = self.connection.execute(
+            "SELECT timestamp, player_score, ai_score, winner, duration, seed FROM matches "
+            "WHERE game = ? ORDER BY timestamp DESC LIMIT ?", (game, limit))
+        return [{"timestamp": row[0], "player_score": row[1], "ai_score": row[2], "winner": row[3] or None,
+                 "duration": row[4], "seed": row[5]} for row in rows]
+
+    def win_rates(self, game):
+        """Fracción de victorias por ganador ("Player", "IA", None) y total de partidas."""
+        counts = dict(self.connection.execute("SELECT winner, matches FROM totals WHERE game = ?", (game,)))
+        total = sum(counts.values())
+        rates = {winner or None: count / total for winner, count in counts.items()} if total else {}
+        return rates, total
+
+    def streak(self, game):
+        """Racha actual y mejor racha: ((ganador, partidas), (ganador, partidas)) o None."""
+        row = self.connection.execute(
+            "SELECT winner, length, best_winner, best_length FROM streaks WHERE game = ?", (game,)).fetchone()
+        if row is None:
+            return None
+        return (row[0] or None, row[1]), (row[2] or None, row[3])
+
+
+def summary_lines(history, game, limit=5):
+    """Líneas de texto con el historial para las pantallas de inicio."""
+    if history is None:
+        return []
+    lines = [f"Partida {i + 1}: {RESULT_TEXT[match['winner'] or DRAW]}"
+             for i, match in enumerate(history.recent(game, limit))]
+    rates, total = history.win_rates(game)
+    if total:
+        lines.append(f"Victorias: {rates.get('Player', 0):.0%} de {total} partidas")
+    streak = history.streak(game)
+    if streak and streak[0][0]:
+        who = "tuya" if streak[0][0] == "Player" else "de la IA"
+        lines.append(f"Racha {who}: {streak[0][1]}")
+    return lines
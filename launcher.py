@@ -0,0 +1,206 @@
+"""Lanzador de ARCADE: todos los juegos en un solo proceso.
+
+pygame, la ventana y las fuentes se inicializan una sola vez y todos los juegos se
+cargan al arrancar (importar su módulo no abre ninguna ventana). Después se
+reutilizan: volver a un juego solo lo devuelve a su pantalla de inicio, así que
+cambiar de juego cuesta milisegundos. En un juego, ESC vuelve al menú.
+
+Un juego enchufable es una subclase de scenes.SceneGame (que acepta screen= y
+history=, la ventana y el historial compartidos, y trae start(), tick(ms, eventos)
+y teardown()). Para añadir uno basta una entrada en GAMES.
+
+Con --measure se miden el arranque en frío y los cambios de juego contra sus
+presupuestos (también con el driver de vídeo "dummy" de SDL):
+
+    python launcher.py --measure 20
+"""
+import time
+
+STARTED = time.perf_counter()  # Antes de importar pygame: el arranque en frío lo incluye
+
+import argparse
+import importlib.machinery
+import importlib.util
+import os
+import sys
+from collections import deque
+
+import pygame
+
+from history import MatchHistory
+from profiler import FrameProfiler, summarize
+from render import DirtyRenderer, text_cache
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+WIDTH, HEIGHT = 800, 600
+FPS = 60
+WHITE = (255, 255, 255)
+GRAY = (140, 140, 140)
+
+# Juegos del menú: (clave, título, archivo, clase)
+GAMES = (
+    ("pong", "PONG", "PONG.PY", "Pong"),
+    ("fall_blocks", "FALL BLOCKS", "FALL_BLOCKS.PY", "Game"),
+)
+FONT_SIZES = (20, 25, 30, 40, 50, 70, 80)  # Todos los tamaños de texto de los juegos y el menú
+COLD_START_BUDGET_MS = 1000  # Desde que se importa el lanzador hasta ver el menú, con todo cargado
+SWITCH_BUDGET_MS = 50  # Cambio de juego, hasta su primer frame en pantalla
+
+
+def load_game(name, filename):
+    """Carga un juego desde su archivo (.PY en mayúsculas no se importa por nombre)."""
+    loader = importlib.machinery.SourceFileLoader(name, os.path.join(HERE, filename))
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+class Menu:
+    """Pantalla de elección de juego: teclas 1, 2... o clic en el título."""
+
+    def __init__(self, screen, games):
+        self.games = games
+        self.renderer = DirtyRenderer(screen)
+        self.profiler = FrameProfiler(FPS)
+        self.running = True
+        self.choice = None  # Clave del juego elegido
+
+    def rows(self):
+        for i, (key, title, _, _) in enumerate(self.games):
+            yield key, f"{i + 1}. {title}", (WIDTH // 2, HEIGHT // 3 + 100 + 60 * i)
+
+    def start(self):
+        pygame.display.set_caption("ARCADE")
+        self.running = True
+        self.choice = None
+        self.renderer.invalidate()
+        self.tick(0, [])  # Primer frame en pantalla ya al entrar
+
+    def tick(self, elapsed_ms, events):
+        renderer = self.renderer
+        for event in events:
+            if event.type == pygame.KEYDOWN and pygame.K_1 <= event.key < pygame.K_1 + len(self.games):
+                self.choice = self.games[event.key - pygame.K_1][0]
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                for key, text, center in self.rows():
+                    if text_cache.render(text, 40, WHITE).get_rect(center=center).collidepoint(event.pos):
+                        self.choice = key
+        if self.choice is not None:
+            self.running = False
+            return
+
+        renderer.text("title", "ARCADE", 80, WHITE, center=(WIDTH // 2, HEIGHT // 3))
+        for key, text, center in self.rows():
+            renderer.text(key, text, 40, WHITE, center=center)
+        renderer.text("help", "ESC vuelve a este menú", 25, GRAY, center=(WIDTH // 2, HEIGHT - 40))
+        renderer.present()
+
+    def teardown(self):
+        pass
+
+    def frame_counts(self):
+        return {"blits": self.renderer.blits}
+
+
+class Arcade:
+    """Ventana, reloj, fuentes e historial compartidos y el juego activo."""
+
+    def __init__(self, games=GAMES, record=None):
+        pygame.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.clock = pygame.time.Clock()
+        text_cache.preload(FONT_SIZES)
+        self.history = MatchHistory()  # Un solo hilo de escritura para todos los juegos
+        self.games = {key: (filename, class_name) for key, _, filename, class_name in games}
+        self.record = record
+        self.loaded = {key: self.create(key) for key in self.games}  # Vivos entre cambios de juego
+        self.menu = Menu(self.screen, games)
+        self.active = None
+        self.switches = deque(maxlen=1000)  # (clave, ms) de los últimos cambios de juego
+        self.open_menu()
+        self.cold_start_ms = (time.perf_counter() - STARTED) * 1000
+
+    def create(self, key):
+        """Carga el módulo del juego y lo crea sobre la ventana compartida."""
+        filename, class_name = self.games[key]
+        module = load_game(key, filename)
+        return getattr(module, class_name)(record=self.record, history=self.history, screen=self.screen)
+
+    def switch(self, key, game):
+        """Cierra el juego activo y pone game en marcha, midiendo lo que tarda."""
+        started = time.perf_counter()
+        if self.active is not None:
+            self.active.teardown()
+        game.start()
+        self.active = game
+        self.switches.append((key, (time.perf_counter() - started) * 1000))
+
+    def open_game(self, key):
+        self.switch(key, self.loaded[key])
+
+    def open_menu(self):
+        self.switch("menu", self.menu)
+
+    def run(self):
+        """Bucle principal: reparte los frames al juego activo."""
+        while True:
+            game = self.active
+            profiler = game.profiler
+            profiler.start_frame()
+            elapsed = self.clock.tick(FPS)
+            profiler.lap("tick")
+            events = pygame.event.get()
+            if any(event.type == pygame.QUIT for event in events):
+                break
+            if game is not self.menu and any(event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
+                                             for event in events):
+                self.open_menu()
+                continue
+            game.tick(elapsed, events)
+            profiler.end_frame(**game.frame_counts())
+
+            if not game.running:
+                if game is self.menu:
+                    self.open_game(self.menu.choice)
+                else:
+                    self.open_menu()
+        self.close()
+
+    def close(self):
+        self.active.teardown()
+        self.history.close()
+
+    def measure(self, rounds):
+        """Alterna rounds veces entre todos los juegos y el menú; devuelve los tiempos."""
+        for _ in range(rounds):
+            for key in self.games:
+                self.open_game(key)
+                self.open_menu()
+        switch = summarize([ms for _, ms in self.switches])
+        return {
+            "cold_start_ms": self.cold_start_ms,
+            "cold_start_budget_ms": COLD_START_BUDGET_MS,
+            "switch_ms": switch,
+            "switch_budget_ms": SWITCH_BUDGET_MS,
+            "within_budget": self.cold_start_ms <= COLD_START_BUDGET_MS and switch["max"] <= SWITCH_BUDGET_MS,
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ARCADE")
+    parser.add_argument("--record", metavar="DIR", help="grabar cada partida en DIR (ver replay.py)")
+    parser.add_argument("--measure", type=int, metavar="N", help="medir el arranque y N rondas de cambios de juego y salir")
+    args = parser.parse_args()
+
+    arcade = Arcade(record=args.record)
+    if args.measure:
+        report = arcade.measure(args.measure)
+        arcade.close()
+        pygame.quit()
+        for key, value in report.items():
+            print(f"{key}: {value}")
+        sys.exit(0 if report["within_budget"] else 1)
+    arcade.run()
+    pygame.quit()
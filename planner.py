@@ -0,0 +1,347 @@
+"""Índice de ocupación de bloques y planificador de tiro para la IA de FALL BLOCKS.
+
+``BlockIndex`` guarda los bloques por columna (x) y fila (y) y se actualiza de forma
+incremental cuando un bloque recibe un golpe, cuando aparecen filas nuevas y cuando
+todo el tablero baja (esto último solo mueve un desplazamiento, es O(1)).
+
+``Planner`` puntúa todas las posiciones del lanzador en una pasada sobre el índice y,
+si hay tiempo, mira algunos turnos por delante. La búsqueda es un generador que se
+reanuda en cada frame, así que nunca se pasa del presupuesto de tiempo por frame.
+"""
+import time
+from bisect import bisect_left, bisect_right
+
+BLOCK_SIZE = 30
+BALL_SIZE = 7
+POWERUP_SIZE = 20
+POWERUP_VALUE = 1.5  # Un power-up es una bola más en todos los turnos siguientes
+DAMAGE_VALUE = 0.05  # Restar resistencia sin destruir también cuenta, pero poco
+END_VALUE = 1000  # Ganar o perder la partida pesa más que cualquier tiro
+
+
+# --- ÍNDICE DE OCUPACIÓN ---
+class BlockIndex:
+    """Bloques por columna y fila, con el desplazamiento vertical común aparte."""
+
+    def __init__(self):
+        self.version = 0
+        self.clear()
+
+    def clear(self):
+        self.blocks = {}  # id -> [x, y sin desplazamiento, resistencia]
+        self.columns = {}  # x -> {id, ...}
+        self.rows = {}  # y sin desplazamiento -> {id, ...}
+        self.offset = 0
+        self._xs = None
+        self._stacks = {}
+        self.version += 1
+
+    def _changed(self, x):
+        self._xs = None
+        self._stacks.pop(x, None)
+        self.version += 1
+
+    def add(self, block):
+        """Registra un bloque nuevo (cualquier objeto con id, rect y resistance)."""
+        x = block.rect.x
+        y = block.rect.y - self.offset
+        self.blocks[block.id] = [x, y, block.resistance]
+        self.columns.setdefault(x, set()).add(block.id)
+        self.rows.setdefault(y, set()).add(block.id)
+        self._changed(x)
+
+    def update(self, block_id, resistance):
+        """Actualiza la resistencia tras un golpe; a 0 o menos el bloque desaparece."""
+        entry = self.blocks.get(block_id)
+        if entry is None:
+            return
+        if resistance > 0:
+            entry[2] = resistance
+            self._stacks.pop(entry[0], None)
+            self.version += 1
+            return
+
+        x, y, _ = self.blocks.pop(block_id)
+        self.columns[x].discard(block_id)
+        if not self.columns[x]:
+            del self.columns[x]
+        self.rows[y].discard(block_id)
+        if not self.rows[y]:
+            del self.rows[y]
+        self._changed(x)
+
+    def shift(self, dy):
+        """Baja todo el tablero dy píxeles."""
+        self.offset += dy
+        self.version += 1
+
+    def column_xs(self):
+        """Posiciones x ocupadas, ordenadas."""
+        if self._xs is None:
+            self._xs = sorted(self.columns)
+        return self._xs
+
+    def stack(self, x):
+        """Bloques de una columna como (y sin desplazamiento, resistencia), del más bajo al más alto."""
+        stack = self._stacks.get(x)
+        if stack is None:
+            blocks = self.blocks
+            stack = tuple(sorted(((blocks[i][1], blocks[i][2]) for i in self.columns.get(x, ())), reverse=True))
+            self._stacks[x] = stack
+        return stack
+
+    def top(self, default=None):
+        """y de la fila más alta."""
+        return min(self.rows) + self.offset if self.rows else default
+
+    def lowest_bottom(self, default=None):
+        """Borde inferior del bloque más bajo."""
+        return max(self.rows) + self.offset + BLOCK_SIZE if self.rows else default
+
+    def blocker(self, px, py, exclude=None):
+        """id de un bloque que contiene el punto (px, py), ignorando exclude."""
+        xs = self.column_xs()
+        blocks = self.blocks
+        for x in xs[bisect_right(xs, px - BLOCK_SIZE):bisect_right(xs, px)]:
+            for block_id in self.columns[x]:
+                y = blocks[block_id][1] + self.offset
+                if block_id != exclude and y <= py < y + BLOCK_SIZE:
+                    return block_id
+        return None
+
+    def board(self):
+        """Tablero inmutable: (desplazamiento, columnas (x, pila) ordenadas por x).
+
+        Solo se reconstruyen las pilas de las columnas que cambiaron desde la última vez.
+        """
+        return self.offset, tuple((x, self.stack(x)) for x in self.column_xs())
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __bool__(self):
+        return bool(self.blocks)
+
+
+# --- SIMULACIÓN DE UNA RÁFAGA ---
+def volley(stacks, powerups, balls, reach):
+    """Dispara balls bolas por un carril.
+
+    stacks son las pilas de las columnas que toca el carril y powerups los pares
+    (posición, y) de los power-ups que toca, con la misma referencia de y que las pilas.
+    reach es el borde inferior mínimo que puede tocar una bola antes de salir por arriba.
+    Devuelve (destruidos, daño, posiciones de power-ups recogidos, pilas nuevas).
+    """
+    stacks = [list(stack) for stack in stacks]
+    pending = sorted((item for item in powerups if item[1] + POWERUP_SIZE > reach),
+                     key=lambda item: item[1], reverse=True)  # El más bajo primero
+    kills = damage = 0
+    collected = []
+    remaining = balls
+
+    while remaining > 0:
+        fronts = [stack[0][0] for stack in stacks if stack and stack[0][0] + BLOCK_SIZE > reach]
+        if not fronts:
+            collected.extend(position for position, _ in pending)
+            break
+        front_y = max(fronts)
+
+        # Power-ups que la bola encuentra antes que el primer bloque
+        while pending and pending[0][1] + POWERUP_SIZE > front_y + BLOCK_SIZE:
+            collected.append(pending.pop(0)[0])
+
+        # Cada bola golpea a la vez todos los bloques del frente a la misma altura
+        group = []
+        for stack in stacks:
+            for position, (y, _) in enumerate(stack):
+                if y != front_y:
+                    break
+                group.append((stack, position))
+        shots = min(remaining, min(stack[position][1] for stack, position in group))
+        remaining -= shots
+        damage += shots * len(group)
+        for stack, position in reversed(group):
+            y, resistance = stack[position]
+            if resistance - shots <= 0:
+                del stack[position]
+                kills += 1
+            else:
+                stack[position] = (y, resistance - shots)
+
+    return kills, damage, collected, [tuple(stack) for stack in stacks]
+
+
+# --- PLANIFICADOR ---
+class Planner:
+    """Elige la posición de disparo de la IA dentro de un presupuesto de tiempo por frame."""
+
+    def __init__(self, index, lane=(50, 750), step=2, floor=530, ceiling=-3, block_shift=25, powerup_shift=20,
+                 depth=2, branching=4, budget_ms=2.0, max_nodes=200, memo_size=4096):
+        self.index = index
+        self.lane = lane  #  Recorrido del lanzador
+        self.step = step  #  Píxeles que avanza el lanzador por frame
+        self.floor = floor  #  Si un bloque llega aquí, se acaba la partida
+        self.ceiling = ceiling  #  Las bolas desaparecen antes de tocar bloques por encima de esta y
+        self.block_shift = block_shift
+        self.powerup_shift = powerup_shift
+        self.depth = depth  #  Turnos que se miran por delante (1 = solo este tiro)
+        self.branching = branching  #  Tiros que se exploran en cada turno futuro
+        self.budget_ms = budget_ms  #  None = planificar de una vez
+        self.max_nodes = max_nodes
+        self.memo_size = memo_size
+        self.memo = {}
+        self.node_cost = 0.0  # Segundos que tarda en expandirse un nodo (estimación)
+        self.reset()
+
+    def reset(self):
+        """Descarta el plan en curso."""
+        self.key = None
+        self.search = None
+        self.best = None
+        self.best_value = None
+        self.nodes = 0
+
+    def plan(self, launcher_x, balls, other_balls, lead, powerups):
+        """Avanza la búsqueda; devuelve (x objetivo o None, plan terminado)."""
+        powerups = tuple(sorted((rect.x, rect.y) for rect in powerups))
+        key = (self.index.version, powerups, balls, other_balls, lead)
+        if key != self.key:
+            self.reset()
+            self.key = key
+            board = self.index.board() + (powerups,)
+            self.origin = launcher_x
+            self.search = self.root(board, balls, other_balls, lead)
+
+        if self.search is not None:
+            now = time.perf_counter()
+            deadline = None if self.budget_ms is None else now + self.budget_ms / 1000
+            for _ in self.search:
+                last, now = now, time.perf_counter()
+                # No empezar otro nodo si, a lo que cuesta uno, ya no cabe en el frame
+                self.node_cost = max(now - last, self.node_cost * 0.9)
+                if self.nodes >= self.max_nodes or (deadline and now + self.node_cost >= deadline):
+                    break
+            else:
+                self.search = None
+            if self.nodes >= self.max_nodes:
+                self.search = None
+
+        return self.best, self.search is None
+
+    # --- Puntuación de todas las posiciones en una pasada ---
+    def positions(self, parity_x):
+        start = self.lane[0] + (parity_x - self.lane[0]) % self.step
+        return range(start, self.lane[1] + 1, self.step)
+
+    def score_positions(self, board, balls):
+        """Resultado del tiro para cada posición del lanzador: {x: resultado}.
+
+        Las posiciones que tocan las mismas columnas y power-ups comparten resultado,
+        así que la simulación de la ráfaga se hace una vez por carril distinto.
+        """
+        offset, columns, powerups = board
+        xs = [x for x, _ in columns]
+        pxs = [x for x, _ in powerups]
+        lanes = {}
+        results = {}
+        for lx in self.positions(self.origin):
+            left = lx - BALL_SIZE // 2  # Borde izquierdo de la bola
+            lane = (bisect_right(xs, left - BLOCK_SIZE), bisect_left(xs, left + BALL_SIZE),
+                    bisect_right(pxs, left - POWERUP_SIZE), bisect_left(pxs, left + BALL_SIZE))
+            outcome = lanes.get(lane)
+            if outcome is None:
+                stacks = [stack for _, stack in columns[lane[0]:lane[1]]]
+                lane_powerups = [(i, powerups[i][1] - offset) for i in range(lane[2], lane[3])]
+                kills, damage, collected, new_stacks = volley(stacks, lane_powerups, balls, self.ceiling - offset)
+                gain = kills + POWERUP_VALUE * len(collected) + DAMAGE_VALUE * damage
+                outcome = lanes[lane] = (gain, kills, collected, lane, new_stacks)
+            results[lx] = outcome
+        return results
+
+    def apply(self, board, outcome):
+        """Tablero tras el tiro y tras bajar un turno (las pilas sin tocar se comparten)."""
+        offset, columns, powerups = board
+        _, _, collected, lane, new_stacks = outcome
+        col_lo = lane[0]
+        new_columns = list(columns[:col_lo])
+        new_columns.extend((x, stack) for (x, _), stack in zip(columns[col_lo:lane[1]], new_stacks) if stack)
+        new_columns.extend(columns[lane[1]:])
+        new_powerups = tuple((x, y + self.powerup_shift) for i, (x, y) in enumerate(powerups) if i not in collected)
+        return offset + self.block_shift, tuple(new_columns), new_powerups
+
+    def finished(self, board):
+        """True si algún bloque llegó al límite inferior (fin de la partida)."""
+        offset, columns, _ = board
+        lowest = max((stack[0][0] for _, stack in columns), default=None)
+        return lowest is not None and lowest + offset + BLOCK_SIZE >= self.floor
+
+    def ranked(self, results):
+        """Un representante por carril (el más cercano al origen), del mejor al peor."""
+        best = {}
+        for lx, outcome in results.items():
+            lane = outcome[3]
+            if lane not in best or abs(lx - self.origin) < abs(best[lane][0] - self.origin):
+                best[lane] = (lx, outcome)
+        return sorted(best.values(), key=lambda item: (-item[1][0], abs(item[0] - self.origin)))
+
+    # --- Búsqueda con memoria ---
+    def evaluate(self, board, balls, other_balls, lead, depth):
+        """Valor para quien dispara ahora (negamax sobre los mejores tiros); generador."""
+        key = (board, balls, other_balls, lead, depth)
+        if key in self.memo:
+            return self.memo[key]
+
+        results = self.score_positions(board, balls)
+        self.nodes += 1
+        yield
+
+        value = None
+        complete = True
+        for _, outcome in self.ranked(results)[:self.branching]:
+            gain, kills, collected = outcome[:3]
+            next_board = self.apply(board, outcome)
+            next_lead = lead + kills
+            if self.finished(next_board):
+                child = -END_VALUE if next_lead > 0 else END_VALUE if next_lead < 0 else 0
+            elif depth <= 1:
+                child = 0
+            elif self.nodes >= self.max_nodes:
+                child = 0
+                complete = False
+            else:
+                child = yield from self.evaluate(next_board, other_balls, balls + len(collected), -next_lead, depth - 1)
+            if value is None or gain - child > value:
+                value = gain - child
+
+        value = value or 0
+        if complete:  # Un valor recortado por max_nodes no se reutiliza
+            if len(self.memo) >= self.memo_size:
+                self.memo.clear()
+            self.memo[key] = value
+        return value
+
+    def root(self, board, balls, other_balls, lead):
+        """Búsqueda desde el turno actual; va dejando en self.best la mejor x hasta ahora."""
+        results = self.score_positions(board, balls)
+        self.nodes += 1
+        ranked = self.ranked(results)
+        if not ranked:
+            return
+        self.best, self.best_value = ranked[0][0], ranked[0][1][0]
+        yield
+
+        if self.depth <= 1:
+            return
+        best_value = None
+        for lx, outcome in ranked[:self.branching]:
+            gain, kills, collected = outcome[:3]
+            next_board = self.apply(board, outcome)
+            next_lead = lead + kills
+            if self.finished(next_board):
+                child = -END_VALUE if next_lead > 0 else END_VALUE if next_lead < 0 else 0
+            else:
+                child = yield from self.evaluate(next_board, other_balls, balls + len(collected), -next_lead,
+                                                 self.depth - 1)
+            if best_value is None or gain - child > best_value:
+                best_value = gain - child
+                self.best, self.best_value = lx, best_value
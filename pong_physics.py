@@ -0,0 +1,132 @@
+"""Física de la pelota de PONG en forma cerrada.
+
+Los rebotes en las paredes se calculan "desplegando" la trayectoria: la pelota se
+mueve en línea recta por un campo infinito y la posición real sale de doblar esa
+coordenada sobre [radio, alto - radio]. Las palas se comprueban con barrido
+continuo: se calcula el instante en que la pelota cruza la cara de la pala y dónde
+está en ese momento. Así cada frame cuesta lo mismo a cualquier velocidad y la
+pelota no puede atravesar ni paredes ni palas.
+"""
+import random
+
+
+def fold(position, low, high):
+    """Dobla una coordenada desplegada sobre [low, high].
+
+    Devuelve (posición, sentido): sentido es 1 si la pelota se mueve como en la
+    trayectoria desplegada y -1 si va rebotada.
+    """
+    span = high - low
+    if span <= 0:
+        return low, 1
+    u = (position - low) % (2 * span)
+    if u <= span:
+        return low + u, 1
+    return low + 2 * span - u, -1
+
+
+def paddle_plane(paddle, radius, moving_left):
+    """x del centro de la pelota cuando toca la cara útil de la pala."""
+    x, _, width, _ = paddle
+    return x + width + radius if moving_left else x - radius
+
+
+def step_ball(x, y, dx, dy, radius, height, left, right, deflect=0.2):
+    """Avanza la pelota un frame con rebotes exactos.
+
+    left y right son las palas como (x, y, ancho, alto). Al golpear una pala la
+    pelota invierte dx y el punto de impacto decide hacia dónde sale en vertical
+    (como antes: dy + desvío * deflect, conservando la velocidad).
+    Devuelve (x, y, dx, dy, golpes), donde golpes es la lista de palas golpeadas.
+    """
+    low, high = radius, height - radius
+    remaining = 1.0
+    hits = []
+
+    while remaining > 0:
+        moving_left = dx < 0
+        paddle = left if moving_left else right
+        plane = paddle_plane(paddle, radius, moving_left)
+        t = (plane - x) / dx if dx else float("inf")
+
+        # Solo cuenta si la pelota está delante de la cara y la alcanza en este frame
+        if 0 <= t <= remaining:
+            hit_y, sense = fold(y + dy * t, low, high)
+            _, top, _, paddle_height = paddle
+            if top - radius <= hit_y <= top + paddle_height + radius:
+                offset = (hit_y - top) - paddle_height / 2
+                dy *= sense
+                dy = abs(dy) if dy + offset * deflect > 0 else -abs(dy)
+                dx = -dx
+                x, y = plane, hit_y
+                remaining -= t
+                hits.append(paddle)
+                continue
+
+        y, sense = fold(y + dy * remaining, low, high)
+        x += dx * remaining
+        dy *= sense
+        break
+
+    return x, y, dx, dy, hits
+
+
+def predict_y(x, y, dx, dy, target_x, radius, height, mirror_x=None):
+    """y a la que la pelota cruzará target_x.
+
+    Si la pelota se aleja (va hacia mirror_x), se supone que rebota allí sin cambiar
+    de sentido vertical. Como |dx| y |dy| crecen a la vez, el punto de cruce no
+    depende de la velocidad.
+    """
+    if dx == 0:
+        return y
+    if (target_x - x) * dx >= 0:
+        distance = abs(target_x - x)
+    elif mirror_x is not None:
+        distance = abs(x - mirror_x) + abs(target_x - mirror_x)
+    else:
+        return y
+    unfolded = y + distance * dy / abs(dx)
+    return fold(unfolded, radius, height - radius)[0]
+
+
+class TrajectoryAI:
+    """IA de pala que apunta a donde llegará la pelota.
+
+    reaction_delay son los frames que tarda en reaccionar a una trayectoria nueva
+    (saque o golpe de pala) y error la desviación típica, en píxeles, del punto
+    que predice en cada trayectoria.
+    """
+
+    def __init__(self, plane_x, mirror_x, radius, height, reaction_delay=6, error=15.0, rng=None):
+        self.plane_x = plane_x
+        self.mirror_x = mirror_x
+        self.radius = radius
+        self.height = height
+        self.reaction_delay = reaction_delay
+        self.error = error
+        self.rng = rng or random.Random()
+        self.reset()
+
+    def reset(self):
+        """Olvida la trayectoria actual (al empezar una partida)."""
+        self.trajectory = None
+        self.waiting = 0
+        self.target = self.height / 2
+        self.miss = 0.0
+
+    def update(self, x, y, dx, dy, trajectory):
+        """Devuelve la y (centro) hacia la que mover la pala en este frame.
+
+        trajectory es un contador que el juego incrementa en cada saque y cada golpe.
+        """
+        if trajectory != self.trajectory:
+            self.trajectory = trajectory
+            self.waiting = self.reaction_delay
+            self.miss = self.rng.gauss(0, self.error) if self.error else 0.0
+
+        if self.waiting > 0:
+            self.waiting -= 1
+        else:
+            self.target = predict_y(x, y, dx, dy, self.plane_x, self.radius, self.height, self.mirror_x) + self.miss
+        return self.target
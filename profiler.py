@@ -0,0 +1,127 @@
+"""Medición de tiempos por fase del frame para PONG y FALL BLOCKS.
+
+``FrameProfiler`` toma un tiempo al empezar el frame y otro al terminar cada fase
+(eventos, lógica, dibujo, espera del reloj). Guarda una ventana móvil de frames
+para sacar medias, percentiles e histogramas, cuenta los frames que se pasan del
+presupuesto de ``clock.tick`` y acumula contadores por frame (sprites, colisiones,
+blits). Cuesta unos microsegundos por frame, así que está siempre activo; la
+superposición en pantalla se activa con F3 y el informe se puede guardar en JSON.
+"""
+import json
+import time
+from collections import deque
+
+WHITE = (255, 255, 255)
+YELLOW = (255, 255, 0)
+
+
+def summarize(values):
+    """Media, percentiles 50 y 99 y máximo de una serie (en su misma unidad)."""
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p50": ordered[round(0.50 * last)],
+        "p99": ordered[round(0.99 * last)],
+        "max": ordered[last],
+    }
+
+
+class FrameProfiler:
+    """Tiempos por fase y contadores de los últimos window frames (None: todos)."""
+
+    def __init__(self, fps=60, window=600, tolerance_ms=2.0):
+        self.budget_ms = 1000 / fps
+        self.window = window
+        self.tolerance_ms = tolerance_ms  # clock.tick redondea a milisegundos enteros
+        self.overlay_every = 30  # Frames entre actualizaciones del texto en pantalla
+        self.reset()
+
+    def reset(self):
+        """Olvida todo lo medido (p. ej. tras unos frames de calentamiento)."""
+        self.frame_times = deque(maxlen=self.window)
+        self.phases = {}  # fase -> deque de ms
+        self.counters = {}  # contador -> deque de valores
+        self.frames = 0
+        self.missed = 0  # Frames más largos que el presupuesto del reloj
+        self.started = self.last = None
+        self.lines = []
+
+    # --- Medición ---
+    def start_frame(self):
+        self.started = self.last = time.perf_counter()
+
+    def lap(self, phase):
+        """Cierra la fase que acaba de terminar (nada si no hay un frame empezado)."""
+        if self.last is None:
+            return
+        now = time.perf_counter()
+        times = self.phases.get(phase)
+        if times is None:
+            times = self.phases[phase] = deque(maxlen=self.window)
+        times.append((now - self.last) * 1000)
+        self.last = now
+
+    def end_frame(self, **counts):
+        """Cierra el frame y apunta sus contadores (sprites=..., blits=...)."""
+        if self.started is None:
+            return
+        total = (time.perf_counter() - self.started) * 1000
+        self.started = self.last = None
+        self.frame_times.append(total)
+        self.frames += 1
+        if total > self.budget_ms + self.tolerance_ms:
+            self.missed += 1
+        for name, value in counts.items():
+            values = self.counters.get(name)
+            if values is None:
+                values = self.counters[name] = deque(maxlen=self.window)
+            values.append(value)
+
+    # --- Informe ---
+    def histogram(self, bucket_ms=1.0, buckets=40):
+        """Frames de la ventana por intervalo de bucket_ms; el último cubre todo lo demás."""
+        counts = [0] * buckets
+        for value in self.frame_times:
+            counts[min(int(value / bucket_ms), buckets - 1)] += 1
+        return counts
+
+    def report(self):
+        """Resumen de la ventana como datos simples (listo para JSON)."""
+        frame = summarize(self.frame_times)
+        return {
+            "frames": self.frames,
+            "missed_frames": self.missed,
+            "budget_ms": self.budget_ms,
+            "fps": 1000 / frame["mean"] if frame["mean"] else 0.0,
+            "frame_ms": frame,
+            "histogram_ms": {"bucket_ms": 1.0, "counts": self.histogram()},
+            "phases_ms": {phase: summarize(times) for phase, times in self.phases.items()},
+            "counters": {name: {"mean": sum(values) / len(values), "max": max(values)}
+                         for name, values in self.counters.items() if values},
+        }
+
+    def export(self, path):
+        """Guarda el informe en JSON."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.report(), file, indent=2)
+
+    # --- Superposición ---
+    def draw(self, renderer, x, y):
+        """Dibuja el resumen en pantalla, anclado arriba a la derecha en (x, y).
+
+        El texto se recalcula cada overlay_every frames para no repintar cada frame.
+        """
+        if not self.lines or self.frames % self.overlay_every == 0:
+            frame = summarize(self.frame_times)
+            fps = 1000 / frame["mean"] if frame["mean"] else 0.0
+            self.lines = [f"{fps:.0f} FPS  p50 {frame['p50']:.1f} ms  p99 {frame['p99']:.1f} ms",
+                          f"frames lentos: {self.missed}"]
+            self.lines += [f"{phase}: {sum(times) / len(times):.2f} ms" for phase, times in self.phases.items() if times]
+            self.lines += [f"{name}: {values[-1]}" for name, values in self.counters.items() if values]
+
+        for i, line in enumerate(self.lines):
+            color = YELLOW if i == 0 else WHITE
+            renderer.text(("profiler", i), line, 20, color, topright=(x, y + 18 * i))
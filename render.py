@@ -0,0 +1,163 @@
+"""Capa de dibujo compartida por PONG y FALL BLOCKS.
+
+Cada frame el juego entrega su lista de dibujo a ``DirtyRenderer`` con una clave por
+elemento. El renderer la compara con la del frame anterior y solo repinta y envía a
+la pantalla (``pygame.display.update``) las zonas que han cambiado. Los textos y las
+formas simples se renderizan una vez y se reutilizan desde caché.
+"""
+from collections import OrderedDict
+
+import pygame
+
+BLACK = (0, 0, 0)
+
+
+# --- CACHÉ DE TEXTOS Y FORMAS ---
+class TextCache:
+    """Fuentes por tamaño y textos ya renderizados por (texto, tamaño, color)."""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+
+    def font(self, size):
+        """Fuente por defecto de pygame al tamaño pedido, creada una sola vez."""
+        if size not in self.fonts:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.fonts[size] = pygame.font.Font(None, size)
+        return self.fonts[size]
+
+    def preload(self, sizes):
+        """Crea de antemano las fuentes de estos tamaños (p. ej. al arrancar el lanzador)."""
+        for size in sizes:
+            self.font(size)
+
+    def render(self, text, size, color):
+        """Superficie con el texto; la misma superficie mientras siga en caché."""
+        key = (text, size, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.font(size).render(text, True, color)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_entries:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+
+text_cache = TextCache()
+
+_shapes = {}
+
+
+def solid_surface(size, color):
+    """Rectángulo relleno de un color, compartido entre llamadas."""
+    key = ("rect", size, color)
+    if key not in _shapes:
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        _shapes[key] = surface
+    return _shapes[key]
+
+
+def circle_surface(radius, color):
+    """Círculo relleno con fondo transparente, compartido entre llamadas."""
+    key = ("circle", radius, color)
+    if key not in _shapes:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        _shapes[key] = surface
+    return _shapes[key]
+
+
+# --- RENDERER ---
+class DirtyRenderer:
+    """Dibuja por diferencias con el frame anterior y actualiza solo esas zonas."""
+
+    def __init__(self, screen, background=None, max_rects=64):
+        self.screen = screen
+        self.max_rects = max_rects  # Con más zonas sucias sale más barato repintar todo
+        if background is None:
+            background = pygame.Surface(screen.get_size())
+            background.fill(BLACK)
+        self.background = background  # Capa estática que se usa para borrar
+        self.previous = {}
+        self.current = {}
+        self.full_redraw = True
+        self.blits = 0  # Copias hechas en el último present (para el perfilador)
+        self.updated = 0  # Zonas enviadas a la pantalla en el último present
+
+    def invalidate(self):
+        """Fuerza un repintado completo en el próximo frame (p. ej. tras otra pantalla)."""
+        self.full_redraw = True
+
+    def set_background(self, background):
+        self.background = background
+        self.invalidate()
+
+    def blit(self, key, surface, dest):
+        """Añade un elemento a la lista de dibujo del frame; dest es una posición o un Rect."""
+        if isinstance(dest, pygame.Rect):
+            rect = pygame.Rect(dest.topleft, surface.get_size())
+        else:
+            rect = surface.get_rect(topleft=dest)
+        self.current[key] = (surface, rect)
+
+    def text(self, key, text, size, color, **anchor):
+        """Añade un texto cacheado, colocado con los mismos argumentos que get_rect."""
+        surface = text_cache.render(text, size, color)
+        self.current[key] = (surface, surface.get_rect(**anchor))
+
+    def changed_rects(self):
+        """Zonas de pantalla que difieren del frame anterior."""
+        dirty = []
+        previous = self.previous
+        for key, (surface, rect) in self.current.items():
+            old = previous.get(key)
+            if old is None:
+                dirty.append(rect)
+            elif old[0] is not surface or old[1] != rect:
+                if rect.colliderect(old[1]):
+                    dirty.append(rect.union(old[1]))
+                else:
+                    dirty.extend((rect, old[1]))
+        for key, (surface, rect) in previous.items():
+            if key not in self.current:
+                dirty.append(rect)
+        return dirty
+
+    def present(self):
+        """Pinta el frame y envía a la pantalla solo lo que ha cambiado."""
+        screen = self.screen
+        dirty = None if self.full_redraw else self.changed_rects()
+        if dirty is None or len(dirty) > self.max_rects:
+            screen.blit(self.background, (0, 0))
+            for surface, rect in self.current.values():
+                screen.blit(surface, rect)
+            pygame.display.flip()
+            self.full_redraw = False
+            self.blits = len(self.current) + 1
+            self.updated = 1
+        else:
+            self.blits = self.updated = len(dirty)
+            if dirty:
+                # Cada zona se repinta desde el fondo y recortada, para no mezclar
+                # dos veces los bordes con transparencia de lo que no ha cambiado
+                layers = [[] for _ in dirty]
+                for surface, rect in self.current.values():
+                    for index in rect.collidelistall(dirty):
+                        layers[index].append((surface, rect))
+                for area, items in zip(dirty, layers):
+                    screen.set_clip(area)
+                    screen.blit(self.background, area, area)
+                    for surface, rect in items:
+                        screen.blit(surface, rect)
+                    self.blits += len(items)
+                screen.set_clip(None)
+                pygame.display.update(dirty)
+
+        self.previous = self.current
+        self.current = {}
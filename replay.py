@@ -0,0 +1,254 @@
+"""Grabación y repetición determinista de partidas de PONG y FALL BLOCKS.
+
+Una partida queda definida por su estado inicial y la entrada de cada frame. Una
+grabación guarda la semilla, un byte de entrada por frame y, cada cierto número de
+frames, una foto del estado completo del juego. El formato es binario de ancho fijo:
+
+    cabecera | entradas (1 byte por frame) | fotos (JSON comprimido) | índice de fotos
+
+Con ``mmap`` la entrada de cualquier frame está en un desplazamiento conocido y la foto
+anterior a cualquier frame sale de una búsqueda binaria en el índice, así que saltar a
+un frame solo simula los frames que faltan desde esa foto.
+
+Los juegos ofrecen ``capture_state()``, ``restore_state(state)``, ``replay_step(entrada)``
+y ``draw()`` para que ``Playback`` pueda reproducirlos.
+"""
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+from bisect import bisect_right
+
+import pygame
+
+MAGIC = b"ARPL"
+VERSION = 1
+HEADER = struct.Struct("<4sH2sQIIIQ")  # Firma, versión, juego, semilla, frames, intervalo, fotos, offset del índice
+INDEX_ENTRY = struct.Struct("<IQI")  # Frame, offset y tamaño de cada foto
+SPEEDS = (1, 4, 16)  # Velocidades de reproducción en ventana
+SEEK_SECONDS = 10  # Salto de las flechas en la reproducción en ventana
+
+
+def canonical(state):
+    """El estado tal como queda al guardarlo (tuplas como listas), para compararlo."""
+    return json.loads(json.dumps(state))
+
+
+def replay_path(directory, prefix, seed):
+    """Nombre de archivo para la grabación de una partida."""
+    return os.path.join(directory, f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}-{seed}.rpl")
+
+
+# --- GRABACIÓN ---
+class Recorder:
+    """Acumula las entradas y las fotos de una partida y las escribe al terminar."""
+
+    def __init__(self, game, seed, snapshot_interval=300):
+        self.game = game  # Código de dos bytes del juego (b"PG", b"FB")
+        self.seed = seed
+        self.snapshot_interval = snapshot_interval
+        self.inputs = bytearray()
+        self.snapshots = []  # (frame, foto comprimida)
+
+    def snapshot_due(self):
+        """Si toca guardar una foto antes del frame siguiente."""
+        frame = len(self.inputs)
+        return frame % self.snapshot_interval == 0 and not (self.snapshots and self.snapshots[-1][0] == frame)
+
+    def snapshot(self, state):
+        """Guarda una foto del estado tras los frames grabados hasta ahora."""
+        frame = len(self.inputs)
+        blob = zlib.compress(json.dumps(state, separators=(",", ":")).encode())
+        if self.snapshots and self.snapshots[-1][0] == frame:
+            self.snapshots[-1] = (frame, blob)
+        else:
+            self.snapshots.append((frame, blob))
+
+    def record(self, inputs):
+        """Añade la entrada de un frame (un byte)."""
+        self.inputs.append(inputs)
+
+    def save(self, path):
+        """Escribe la grabación en path y devuelve la ruta."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        offset = HEADER.size + len(self.inputs)
+        index = []
+        for frame, blob in self.snapshots:
+            index.append(INDEX_ENTRY.pack(frame, offset, len(blob)))
+            offset += len(blob)
+
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.game, self.seed, len(self.inputs),
+                                   self.snapshot_interval, len(self.snapshots), offset))
+            file.write(self.inputs)
+            for _, blob in self.snapshots:
+                file.write(blob)
+            file.write(b"".join(index))
+        return path
+
+    def __len__(self):
+        return len(self.inputs)
+
+
+# --- LECTURA ---
+class Replay:
+    """Grabación abierta con mmap: entradas por desplazamiento y fotos por índice."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.game, self.seed, frames, self.snapshot_interval, count, index_offset = \
+            HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.map.close()
+            raise ValueError(f"{path} no es una grabación válida")
+
+        self.inputs = memoryview(self.map)[HEADER.size:HEADER.size + frames]
+        self.index = [INDEX_ENTRY.unpack_from(self.map, index_offset + i * INDEX_ENTRY.size) for i in range(count)]
+        self.snapshot_frames = [frame for frame, _, _ in self.index]
+
+    def input(self, frame):
+        """Entrada grabada del frame (0 es el primero)."""
+        return self.inputs[frame]
+
+    def nearest(self, frame):
+        """Posición en el índice de la última foto en o antes de frame."""
+        return max(bisect_right(self.snapshot_frames, frame) - 1, 0)
+
+    def snapshot(self, position):
+        """(frame, estado) de la foto en esa posición del índice."""
+        frame, offset, size = self.index[position]
+        return frame, json.loads(zlib.decompress(self.map[offset:offset + size]))
+
+    def close(self):
+        self.inputs.release()
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.inputs)
+
+
+# --- REPRODUCCIÓN ---
+class Playback:
+    """Reproduce una grabación sobre un juego y comprueba el estado en cada foto."""
+
+    def __init__(self, replay, game, verify=True):
+        self.replay = replay
+        self.game = game
+        self.verify = verify
+        self.checkpoints = {frame: position for position, frame in enumerate(replay.snapshot_frames)}
+        self.frame = None
+        self.divergence = None  # Primer frame en el que el juego no coincide con la grabación
+        self.seek(0)
+
+    @property
+    def finished(self):
+        return self.frame >= len(self.replay)
+
+    def seek(self, frame):
+        """Salta a frame desde la foto más cercana, sin repetir la partida desde el principio."""
+        frame = max(0, min(frame, len(self.replay)))
+        position = self.replay.nearest(frame)
+        if self.frame is None or frame < self.frame or self.replay.snapshot_frames[position] > self.frame:
+            self.frame, state = self.replay.snapshot(position)
+            self.game.restore_state(state)
+        while self.frame < frame:
+            self.step()
+
+    def step(self):
+        """Simula el frame siguiente con su entrada grabada."""
+        self.game.replay_step(self.replay.input(self.frame))
+        self.frame += 1
+        position = self.checkpoints.get(self.frame)
+        if self.verify and self.divergence is None and position is not None:
+            if canonical(self.game.capture_state()) != self.replay.snapshot(position)[1]:
+                self.divergence = self.frame
+
+    def run(self):
+        """Simula hasta el final sin ventana, tan rápido como permita la CPU."""
+        while not self.finished:
+            self.step()
+        return self.divergence
+
+
+def watch(playback, fps=60, speed=1):
+    """Reproduce en ventana a speed frames de juego por frame de pantalla.
+
+    Teclas: 1, 2 y 3 cambian a 1×, 4× y 16×; las flechas saltan atrás o adelante;
+    espacio pausa. Se sale cerrando la ventana o con Escape.
+    """
+    clock = pygame.time.Clock()
+    paused = False
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return
+                if event.key in (pygame.K_1, pygame.K_2, pygame.K_3):
+                    speed = SPEEDS[event.key - pygame.K_1]
+                elif event.key == pygame.K_LEFT:
+                    playback.seek(playback.frame - SEEK_SECONDS * fps)
+                elif event.key == pygame.K_RIGHT:
+                    playback.seek(playback.frame + SEEK_SECONDS * fps)
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+
+        if not paused:
+            for _ in range(speed):
+                if playback.finished:
+                    break
+                playback.step()
+
+        playback.game.draw()
+        clock.tick(fps)
+
+
+def play(path, game, make_game, fps=60, speed=1, headless=False, start=0):
+    """Reproduce la grabación path de game (código de dos bytes del juego).
+
+    make_game(headless) crea el juego. Sin ventana simula todo a máxima velocidad.
+    Devuelve los frames simulados, el tiempo y el primer frame que no coincide con
+    las fotos grabadas (None si la repetición es exacta).
+    """
+    with Replay(path) as replay:
+        if replay.game != game:
+            raise ValueError(f"{path} es una grabación de otro juego ({replay.game.decode()})")
+
+        playback = Playback(replay, make_game(headless))
+        started = time.perf_counter()
+        playback.seek(start)
+        if headless:
+            playback.run()
+        else:
+            watch(playback, fps, speed)
+        elapsed = time.perf_counter() - started
+
+        return {
+            "seed": replay.seed,
+            "frames": playback.frame - start,
+            "seconds": elapsed,
+            "frames_per_second": (playback.frame - start) / elapsed if elapsed else 0.0,
+            "divergence": playback.divergence,
+        }
+
+
+def add_arguments(parser):
+    """Opciones de línea de comandos para grabar y reproducir, comunes a los dos juegos."""
+    parser.add_argument("--record", metavar="DIR", help="grabar cada partida en el directorio DIR")
+    parser.add_argument("--replay", metavar="FILE", help="reproducir una partida grabada")
+    parser.add_argument("--speed", type=int, choices=SPEEDS, default=1, help="velocidad de la reproducción en ventana")
+    parser.add_argument("--headless", action="store_true", help="reproducir sin ventana a máxima velocidad")
+    parser.add_argument("--start", type=int, default=0, metavar="FRAME", help="empezar la reproducción en FRAME")
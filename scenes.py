@@ -0,0 +1,228 @@
+"""Escenas, temporizadores y bucle de paso fijo compartidos por PONG y FALL BLOCKS.
+
+Cada juego se divide en escenas (inicio, partida, pausas, ganador) y ``Scheduler``
+decide cuál recibe los eventos, los pasos de lógica y el dibujo. Nada bloquea: las
+esperas son temporizadores que cuentan pasos de lógica, así que la ventana sigue
+atendiendo eventos durante cualquier pausa y un juego puede correr días sin que la
+pila ni la cola de eventos crezcan.
+
+La lógica avanza siempre en pasos de 1/fps segundos. El tiempo real de cada frame se
+acumula y se consume en pasos enteros, así que la velocidad del juego no depende de
+lo rápido que se dibuje.
+
+``SceneGame`` es la base de los juegos: ventana, historial, grabaciones, perfilador,
+bucle principal y los ganchos start/tick/teardown que usa el lanzador.
+"""
+import heapq
+import itertools
+
+import pygame
+
+import replay
+from history import MatchHistory
+from profiler import FrameProfiler
+from render import DirtyRenderer
+
+
+class Scene:
+    """Una pantalla del juego. Todas las funciones son opcionales.
+
+    enter() se llama al entrar, event(evento) por cada evento de pygame, update() en
+    cada paso de lógica y draw() una vez por frame dibujado.
+    """
+
+    def __init__(self, enter=None, event=None, update=None, draw=None):
+        self.enter = enter
+        self.event = event
+        self.update = update
+        self.draw = draw
+
+
+class Scheduler:
+    """Escena actual, temporizadores por pasos y acumulador de tiempo.
+
+    Con profiler (un FrameProfiler), cada frame se apuntan las fases events, update y draw.
+    """
+
+    def __init__(self, fps=60, max_steps=5, profiler=None):
+        self.step_ms = 1000 / fps
+        self.max_steps = max_steps  # Si el equipo no da abasto, se pierde tiempo en vez de acumular retraso
+        self.accumulator = 0.0
+        self.steps = 0  # Pasos de lógica desde el principio
+        self.timers = []  # Montículo de (paso, orden, función)
+        self.order = itertools.count()
+        self.scenes = {}
+        self.scene = None
+        self.name = None
+        self.profiler = profiler
+
+    def add(self, name, scene):
+        self.scenes[name] = scene
+
+    def switch(self, name):
+        """Cambia de escena; los temporizadores pendientes se cancelan."""
+        self.timers.clear()
+        self.name = name
+        self.scene = self.scenes[name]
+        if self.scene.enter is not None:
+            self.scene.enter()
+
+    def pause(self, name, ms):
+        """Pasa a la escena name durante ms milisegundos y vuelve a la actual."""
+        back = self.name
+        self.switch(name)
+        self.after(ms, lambda: self.switch(back))
+
+    def after(self, ms, callback):
+        """Llama a callback cuando hayan pasado ms milisegundos de lógica."""
+        steps = max(1, round(ms / self.step_ms))
+        heapq.heappush(self.timers, (self.steps + steps, next(self.order), callback))
+
+    def tick(self, elapsed_ms, events):
+        """Reparte los eventos, avanza los pasos de lógica que tocan y dibuja.
+
+        Devuelve los pasos simulados en este frame.
+        """
+        profiler = self.profiler
+        for event in events:
+            if self.scene.event is not None:
+                self.scene.event(event)
+        if profiler is not None:
+            profiler.lap("events")
+
+        self.accumulator += elapsed_ms
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_ms
+
+        for _ in range(steps):
+            self.steps += 1
+            timers = self.timers
+            while timers and timers[0][0] <= self.steps:
+                heapq.heappop(timers)[2]()
+            if self.scene.update is not None:
+                self.scene.update()
+        if profiler is not None:
+            profiler.lap("update")
+
+        if self.scene.draw is not None:
+            self.scene.draw()
+        if profiler is not None:
+            profiler.lap("draw")
+        return steps
+
+
+class SceneGame:
+    """Base de PONG y FALL BLOCKS: todo lo que no depende del juego.
+
+    Cada juego define caption, replay_name (prefijo de sus grabaciones), state_fields
+    (atributos que forman el estado de una partida), create_scenes() con al menos la
+    escena "start", frame_counts() y los atributos seed y rng.
+    """
+    caption = "ARCADE"
+    replay_name = "partida"
+    state_fields = ()
+    fps = 60
+
+    def setup(self, headless, size, screen=None, history=True, record=None, profile=None):
+        """Prepara ventana, historial, grabación y perfilador (sin ventana si headless es True).
+
+        Con screen, el juego dibuja en esa ventana ya abierta (la del lanzador) en vez
+        de abrir la suya. history puede ser True (historial propio en disco), False o
+        un MatchHistory compartido. Con record, cada partida se graba en ese
+        directorio (ver replay.py). Con profile, al salir se guardan en ese archivo
+        JSON los tiempos por fase del frame (ver profiler.py).
+        """
+        self.headless = headless
+        if headless:
+            self.screen = None
+            self.renderer = None
+            self.clock = None
+        else:
+            if screen is None:
+                pygame.init()
+                screen = pygame.display.set_mode(size)
+            self.screen = screen
+            self.renderer = DirtyRenderer(screen)  # Solo actualiza las zonas que cambian
+            self.clock = pygame.time.Clock()
+        self.running = True
+
+        if history is True:
+            history = None if headless else MatchHistory()  # Historial en disco, compartido por los juegos
+        self.history = history or None
+        self.record = record  # Directorio de grabaciones (None: no se graba)
+        self.recorder = None
+        self.profiler = FrameProfiler(self.fps)  # Tiempos por fase del frame
+        self.profile = profile  # Archivo JSON para el informe del perfilador
+        self.show_profiler = False  # Superposición con los tiempos (F3)
+        self.scheduler = None if headless else self.create_scenes()
+
+    # --- Grabaciones ---
+    def save_replay(self):
+        """Cierra la grabación de la partida actual y la escribe en disco."""
+        recorder, self.recorder = self.recorder, None
+        recorder.snapshot(self.capture_state())  # Foto final: la repetición se comprueba hasta el último frame
+        path = recorder.save(replay.replay_path(self.record, self.replay_name, self.seed))
+        if not self.headless:
+            print(f"Partida grabada en {path}")
+
+    def capture_state(self):
+        """Estado de la partida como datos simples (fotos de las grabaciones)."""
+        version, internal, gauss = self.rng.getstate()
+        state = {name: getattr(self, name) for name in self.state_fields}
+        state["rng"] = [version, list(internal), gauss]
+        return state
+
+    def restore_state(self, state):
+        """Vuelve a un estado guardado con capture_state."""
+        for name in self.state_fields:
+            setattr(self, name, state[name])
+        version, internal, gauss = state["rng"]
+        self.rng.setstate((version, tuple(internal), gauss))
+        self.running = True
+
+    # --- Ganchos del lanzador ---
+    def start(self):
+        """Pone el juego en su pantalla de inicio (también al volver desde el lanzador)."""
+        pygame.display.set_caption(self.caption)
+        self.running = True
+        self.renderer.invalidate()
+        self.scheduler.switch("start")
+
+    def tick(self, elapsed_ms, events=None):
+        """Un frame: eventos, los pasos de lógica de paso fijo que toquen y dibujo.
+
+        Sin events, el juego los recoge él mismo de la cola de pygame.
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+        return self.scheduler.tick(elapsed_ms, events)
+
+    def teardown(self):
+        """Guarda lo pendiente al salir; el juego queda listo para volver a empezar."""
+        if self.recorder is not None and len(self.recorder):
+            self.save_replay()
+        if self.profile is not None:
+            self.profiler.export(self.profile)
+
+    def run(self):
+        """Bucle principal del juego por separado: nunca se bloquea ni se llama a sí mismo."""
+        self.start()
+
+        profiler = self.profiler
+        while self.running:
+            profiler.start_frame()
+            elapsed = self.clock.tick(self.fps)
+            profiler.lap("tick")
+            self.tick(elapsed)
+            profiler.end_frame(**self.frame_counts())
+
+        self.teardown()
+        if self.history is not None:
+            self.history.close()  # Escribir lo que quede pendiente
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Sin ventana real
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from launcher import load_game  # Después de preparar sys.path
+
+
+@pytest.fixture(scope="session")
+def fall_blocks():
+    return load_game("fall_blocks", "FALL_BLOCKS.PY")
+
+
+@pytest.fixture(scope="session")
+def pong():
+    return load_game("pong", "PONG.PY")
@@ -0,0 +1,27 @@
+"""Partidas IA contra IA sin ventana: resumen de un lote y repetibilidad por semilla."""
+import pytest
+
+SUMMARY_KEYS = {"matches", "win_rate", "timeouts", "avg_frames", "avg_turns", "avg_blocks_destroyed"}
+
+
+def test_run_batch_summary(fall_blocks):
+    summary = fall_blocks.run_batch(4, processes=1, seed=10)
+    assert set(summary) == SUMMARY_KEYS
+    assert summary["matches"] == 4
+    assert set(summary["win_rate"]) == {"Player", "IA", "Empate"}
+    assert sum(summary["win_rate"].values()) == pytest.approx(1.0)
+    assert 0 < summary["avg_frames"] < 100000
+
+
+def test_run_batch_is_deterministic(fall_blocks):
+    assert fall_blocks.run_batch(4, processes=1, seed=10) == fall_blocks.run_batch(4, processes=1, seed=10)
+
+
+def test_same_seed_same_match(fall_blocks):
+    assert fall_blocks.simulate_match(3) == fall_blocks.simulate_match(3)
+
+
+def test_summarize_empty_batch(fall_blocks):
+    summary = fall_blocks.summarize_results([])
+    assert summary["matches"] == 0
+    assert summary["avg_frames"] == 0.0
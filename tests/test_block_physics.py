@@ -0,0 +1,59 @@
+"""Motor de NumPy de FALL BLOCKS: mismas partidas que con sprites y colisiones por lotes."""
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from planner import BlockIndex
+
+block_physics = pytest.importorskip("block_physics")  # Necesita NumPy
+BALL_SIZE, BLOCK_SIZE = block_physics.BALL_SIZE, block_physics.BLOCK_SIZE
+
+
+def block(block_id, x, y, resistance):
+    return SimpleNamespace(id=block_id, rect=pygame.Rect(x, y, BLOCK_SIZE, BLOCK_SIZE), resistance=resistance,
+                           image=pygame.Surface((BLOCK_SIZE, BLOCK_SIZE)))
+
+
+def ball(x, y):
+    return SimpleNamespace(rect=pygame.Rect(x, y, BALL_SIZE, BALL_SIZE), speed_y=-5)
+
+
+@pytest.mark.parametrize("seed", [0, 5, 6, 9])
+def test_vectorized_engine_plays_the_same_matches(fall_blocks, seed):
+    sprites = fall_blocks.run_batch(2, processes=1, seed=seed, vectorized=False)
+    arrays = fall_blocks.run_batch(2, processes=1, seed=seed, vectorized=True)
+    assert arrays == sprites
+
+
+def test_block_hit_by_several_balls_dies_once():
+    engine = block_physics.ArrayEngine()
+    index = BlockIndex()
+    for item in (block(1, 100, 100, 2), block(2, 200, 100, 5)):
+        engine.blocks.add(item)
+        index.add(item)
+    for x in (100, 110, 120):  # Tres bolas sobre el primer bloque en el mismo frame
+        engine.balls.add(ball(x, 110))
+    engine.balls.add(ball(400, 300))  # Esta no toca nada
+
+    kills, collected = engine.collide()
+    assert (kills, collected) == (1, 0)
+    assert engine.hits == [(1, -1)]  # Un solo golpe por bloque, con la resistencia final
+    assert engine.blocks.x.tolist() == [200]
+    assert len(engine.balls) == 1
+
+    for block_id, resistance in engine.hits:
+        index.update(block_id, resistance)
+    assert list(index.blocks) == [2]
+
+
+def test_surviving_block_loses_one_point_per_ball():
+    engine = block_physics.ArrayEngine()
+    engine.blocks.add(block(1, 100, 100, 5))
+    engine.balls.add(ball(100, 110))
+    engine.balls.add(ball(120, 110))
+
+    assert engine.collide() == (0, 0)
+    assert engine.blocks.resistance.tolist() == [3]
+    assert engine.hits == [(1, 3)]
+    assert not engine.balls
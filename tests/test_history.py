@@ -0,0 +1,63 @@
+"""Historial de partidas: consultas de resumen, rachas y escrituras con la base bloqueada."""
+import sqlite3
+
+import pytest
+
+from history import MatchHistory
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = MatchHistory(str(tmp_path / "historial.db"), timeout=0.01)
+    yield history
+    history.close()
+
+
+def play(history, winners, game="PONG"):
+    for timestamp, winner in enumerate(winners, 1):
+        history.record(game, 1, 0, winner, 30.0, seed=timestamp, timestamp=timestamp)
+    history.flush()
+
+
+def test_recent_newest_first(history):
+    play(history, ["Player", "Player", "IA", None, "IA"])
+    assert [match["seed"] for match in history.recent("PONG", limit=3)] == [5, 4, 3]
+    assert [match["winner"] for match in history.recent("PONG", limit=3)] == ["IA", None, "IA"]
+    assert history.recent("FALL BLOCKS") == []
+
+
+def test_win_rates(history):
+    play(history, ["Player", "Player", "IA", None, "IA", "IA"])
+    rates, total = history.win_rates("PONG")
+    assert total == 6
+    assert rates == pytest.approx({"Player": 2 / 6, "IA": 3 / 6, None: 1 / 6})
+    assert history.win_rates("FALL BLOCKS") == ({}, 0)
+
+
+def test_streaks(history):
+    assert history.streak("PONG") is None
+    play(history, ["Player", "Player", "IA", "IA"])
+    assert history.streak("PONG") == (("IA", 2), ("Player", 2))  # Empate en la mejor: se queda la primera
+
+    play(history, ["IA"])
+    assert history.streak("PONG") == (("IA", 3), ("IA", 3))
+
+
+def test_draw_resets_streak(history):
+    play(history, ["Player", "Player", None])
+    assert history.streak("PONG") == ((None, 1), ("Player", 2))
+    play(history, ["Player"])
+    assert history.streak("PONG") == (("Player", 1), ("Player", 2))
+
+
+def test_locked_database_drops_batch_and_keeps_writer(history, capsys):
+    lock = sqlite3.connect(history.path)
+    lock.execute("BEGIN EXCLUSIVE")  # El otro juego escribiendo
+    play(history, ["Player"])  # flush() vuelve aunque no se pueda escribir
+    lock.rollback()
+    lock.close()
+
+    assert "se pierden 1 partidas" in capsys.readouterr().err
+    assert history.thread.is_alive()
+    play(history, ["IA"])
+    assert [match["winner"] for match in history.recent("PONG")] == ["IA"]
@@ -0,0 +1,32 @@
+"""El planificador predice exactamente lo que hace cada ráfaga de verdad."""
+
+
+def test_volley_prediction_matches_each_turn(fall_blocks):
+    game = fall_blocks.Game(headless=True, seed=5)
+    game.ai_sides = {"IA", "Player"}
+    game.reset_game()
+    turns = []
+
+    shoot_ball, switch_turn = game.shoot_ball, game.switch_turn
+
+    def shoot():
+        powerups = tuple(sorted((powerup.rect.x, powerup.rect.y) for powerup in game.powerups))
+        balls = game.player_balls if game.turn == "Player" else game.ai_balls
+        outcome = game.planner.score_positions(game.index.board() + (powerups,), balls)[game.launcher.x]
+        turns.append({"predicted": (outcome[1], len(outcome[2])),
+                      "before": (game.player_score + game.ai_score, game.player_balls + game.ai_balls)})
+        shoot_ball()
+
+    def switch():
+        turn = turns[-1]
+        kills = game.player_score + game.ai_score - turn["before"][0]
+        powerups = game.player_balls + game.ai_balls - turn["before"][1]  # Cada power-up da una bola
+        turn["actual"] = (kills, powerups)
+        switch_turn()
+
+    game.shoot_ball, game.switch_turn = shoot, switch
+    game.simulate()
+
+    assert len(turns) > 5
+    for turn in turns:
+        assert turn["actual"] == turn["predicted"]
@@ -0,0 +1,36 @@
+"""La predicción de la IA coincide con la física real de la pelota."""
+import random
+
+from pong_physics import predict_y, step_ball
+
+RADIUS, HEIGHT = 10, 600
+AWAY = (-10 ** 6, -10 ** 6, 10, 1)  # Pala fuera del campo: la pelota no la toca nunca
+
+
+def test_predict_y_matches_simulated_crossing():
+    rng = random.Random(0)
+    for _ in range(500):
+        dx = rng.choice((1, -1)) * rng.randint(1, 60)
+        dy = rng.uniform(-60, 60)
+        x, y = 400.0, rng.uniform(RADIUS, HEIGHT - RADIUS)
+        frames = rng.randint(1, 40)
+        target_x = x + frames * dx  # La pelota cae justo en target_x al final de un frame
+        expected = predict_y(x, y, dx, dy, target_x, RADIUS, HEIGHT)
+
+        for _ in range(frames):
+            x, y, dx, dy, hits = step_ball(x, y, dx, dy, RADIUS, HEIGHT, AWAY, AWAY)
+            assert not hits
+        assert x == target_x
+        assert abs(y - expected) < 1e-6
+
+
+def test_fast_ball_does_not_tunnel_through_paddle():
+    x, y, dx, dy = 400.0, 300.0, 2000.0, 2000.0
+    right_x = 770
+    hit_y = predict_y(x, y, dx, dy, right_x - RADIUS, RADIUS, HEIGHT)
+    right = (right_x, hit_y - 50, 10, 100)  # Pala centrada donde llegará la pelota
+
+    x, y, dx, dy, hits = step_ball(x, y, dx, dy, RADIUS, HEIGHT, AWAY, right)
+    assert hits and hits[0] == right
+    assert dx < 0
+    assert x < right_x
@@ -0,0 +1,84 @@
+"""Perfilador de frames con un reloj simulado: percentiles, histograma y frames lentos."""
+import json
+
+import pytest
+
+import profiler
+from profiler import FrameProfiler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Reloj que solo avanza cuando la prueba lo pide (en ms)."""
+    class Clock:
+        now = 0.0
+
+        def __call__(self):
+            return self.now / 1000
+
+        def advance(self, ms):
+            self.now += ms
+
+    fake = Clock()
+    monkeypatch.setattr(profiler.time, "perf_counter", fake)
+    return fake
+
+
+def play(frames, clock, durations, **counts):
+    for ms in durations:
+        frames.start_frame()
+        clock.advance(ms / 2)
+        frames.lap("update")
+        clock.advance(ms / 2)
+        frames.lap("draw")
+        frames.end_frame(**counts)
+
+
+def test_percentiles_histogram_and_missed_frames(clock):
+    frames = FrameProfiler(fps=60, tolerance_ms=2.0)  # Lento: más de 16.7 + 2 ms
+    play(frames, clock, [10.5] * 90 + [18.5] * 5 + [19.5] * 4 + [40.0])
+    report = frames.report()
+
+    assert report["frames"] == 100
+    assert report["missed_frames"] == 5  # Los de 19.5 y 40 ms; 18.5 entra en la tolerancia
+    assert report["frame_ms"]["p50"] == pytest.approx(10.5)
+    assert report["frame_ms"]["p99"] == pytest.approx(19.5)
+    assert report["frame_ms"]["max"] == pytest.approx(40.0)
+    counts = report["histogram_ms"]["counts"]
+    assert (counts[10], counts[18], counts[19], counts[-1]) == (90, 5, 4, 1)  # 40 ms cae en el último
+    assert sum(counts) == 100
+    assert report["phases_ms"]["update"]["p50"] == pytest.approx(5.25)
+
+
+def test_counters_and_export(clock, tmp_path):
+    frames = FrameProfiler()
+    play(frames, clock, [10.0, 20.0], blits=3)
+    play(frames, clock, [10.0], blits=9)
+    report = frames.report()
+    assert report["counters"] == {"blits": {"mean": 5.0, "max": 9}}
+    assert report["fps"] == pytest.approx(1000 / (40 / 3))
+
+    path = tmp_path / "tiempos.json"
+    frames.export(str(path))
+    assert json.loads(path.read_text(encoding="utf-8")) == json.loads(json.dumps(report))
+
+
+def test_window_and_reset(clock):
+    frames = FrameProfiler(window=3)
+    play(frames, clock, [1.0, 2.0, 3.0, 4.0])
+    assert frames.report()["frame_ms"]["max"] == pytest.approx(4.0)
+    assert frames.report()["frame_ms"]["mean"] == pytest.approx(3.0)  # Solo los 3 últimos
+    frames.reset()
+    assert frames.report()["frames"] == 0
+
+
+def test_laps_outside_a_frame_are_ignored(clock):
+    frames = FrameProfiler()
+    frames.lap("events")
+    frames.end_frame(blits=1)
+    assert frames.report()["frames"] == 0
+    assert frames.report()["phases_ms"] == {}
+
+    play(frames, clock, [5.0])
+    frames.lap("draw")  # Tras end_frame no hay frame abierto
+    assert len(frames.phases["draw"]) == 1
@@ -0,0 +1,44 @@
+"""Dibujar por zonas sucias deja la pantalla igual que repintarla entera."""
+import random
+
+import pygame
+import pytest
+
+from render import DirtyRenderer, circle_surface, solid_surface
+
+SIZE = (320, 240)
+
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.display.init()
+    pygame.display.set_mode(SIZE)
+    yield
+    pygame.display.quit()
+
+
+@pytest.mark.parametrize("max_rects", [64, 4])  # Con 4, también el repintado completo por exceso de zonas
+def test_dirty_frames_match_full_redraw(max_rects):
+    dirty = DirtyRenderer(pygame.Surface(SIZE), max_rects=max_rects)
+    full = DirtyRenderer(pygame.Surface(SIZE))
+    ball = circle_surface(6, (255, 255, 255))
+    block = solid_surface((20, 20), (200, 80, 40))
+    rng = random.Random(1)
+    items = {i: [rng.randint(0, 300), rng.randint(0, 220)] for i in range(8)}
+
+    for frame in range(120):
+        for key, position in list(items.items()):
+            position[0] += rng.randint(-5, 5)
+            position[1] += rng.randint(-5, 5)
+            if rng.random() < 0.02:
+                del items[key]  # Elementos que desaparecen
+        if frame % 10 == 0:
+            items[100 + frame] = [rng.randint(0, 300), rng.randint(0, 220)]
+
+        full.invalidate()
+        for renderer in (dirty, full):
+            for key, position in items.items():
+                renderer.blit(key, ball if key % 2 else block, tuple(position))
+            renderer.text("score", f"{frame}", 20, (255, 255, 255), topleft=(5, 5))
+            renderer.present()
+        assert pygame.image.tobytes(dirty.screen, "RGB") == pygame.image.tobytes(full.screen, "RGB"), frame
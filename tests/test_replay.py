@@ -0,0 +1,99 @@
+"""Grabar partidas sin ventana y repetirlas: formato, saltos y comprobación de estado."""
+import os
+import random
+
+import pytest
+
+import replay
+
+
+def recorded(directory):
+    (name,) = os.listdir(directory)
+    return os.path.join(directory, name)
+
+
+@pytest.fixture
+def pong_replay(tmp_path, pong):
+    """Partida de PONG completa con un jugador que pulsa teclas al azar."""
+    game = pong.Pong(headless=True, seed=7, record=str(tmp_path), history=False)
+    keys = random.Random(7)
+    while game.running:
+        game.step(keys.choice((0, pong.KEY_W, pong.KEY_S)))
+    return recorded(tmp_path), game.frame
+
+
+@pytest.fixture
+def fall_blocks_replay(tmp_path, fall_blocks):
+    """Partida de FALL BLOCKS IA contra IA."""
+    result = fall_blocks.simulate_match(3, record=str(tmp_path))
+    return recorded(tmp_path), result["frames"]
+
+
+def test_pong_round_trip(pong, pong_replay):
+    path, frames = pong_replay
+    summary = replay.play(path, b"PG", lambda headless: pong.Pong(headless=headless, history=False), headless=True)
+    assert summary["frames"] == frames
+    assert summary["divergence"] is None
+
+
+def test_fall_blocks_round_trip(fall_blocks, fall_blocks_replay):
+    path, frames = fall_blocks_replay
+    with replay.Replay(path) as recording:
+        assert recording.seed == 3  # La semilla pedida a simulate_match
+    summary = replay.play(path, b"FB", lambda headless: fall_blocks.Game(headless=headless, history=False),
+                          headless=True)
+    assert summary["frames"] == frames
+    assert summary["divergence"] is None
+
+
+def test_fall_blocks_replays_on_vectorized_engine(fall_blocks, fall_blocks_replay):
+    pytest.importorskip("numpy")
+    path, _ = fall_blocks_replay
+    summary = replay.play(path, b"FB",
+                          lambda headless: fall_blocks.Game(headless=headless, vectorized=True, history=False),
+                          headless=True)
+    assert summary["divergence"] is None
+
+
+def test_header_and_index(pong_replay):
+    path, frames = pong_replay
+    with replay.Replay(path) as recording:
+        assert recording.game == b"PG"
+        assert recording.seed == 7
+        assert len(recording) == frames
+        assert recording.snapshot_frames[0] == 0
+        assert recording.snapshot_frames[-1] == frames  # Foto final
+        interval = recording.snapshot_interval
+        assert recording.snapshot_frames[recording.nearest(interval + 1)] == interval
+        assert recording.snapshot(0)[1]["seed"] == 7
+
+
+def test_seek_then_run_matches_recording(pong, pong_replay):
+    path, frames = pong_replay
+    with replay.Replay(path) as recording:
+        game = pong.Pong(headless=True, history=False)
+        playback = replay.Playback(recording, game)
+        playback.seek(frames // 2)
+        assert playback.frame == frames // 2
+        playback.seek(frames // 4)  # Hacia atrás: vuelve a la foto anterior
+        assert playback.frame == frames // 4
+        assert playback.run() is None
+        assert replay.canonical(game.capture_state()) == recording.snapshot(len(recording.index) - 1)[1]
+
+
+def test_divergence_is_reported(pong, pong_replay):
+    path, _ = pong_replay
+
+    def faster_paddle(headless):
+        game = pong.Pong(headless=headless, history=False)
+        game.paddle_speed += 1  # Otra versión del juego: la repetición ya no coincide
+        return game
+
+    summary = replay.play(path, b"PG", faster_paddle, headless=True)
+    assert summary["divergence"] is not None
+
+
+def test_replay_of_other_game_is_rejected(fall_blocks, pong_replay):
+    path, _ = pong_replay
+    with pytest.raises(ValueError):
+        replay.play(path, b"FB", lambda headless: fall_blocks.Game(headless=headless, history=False), headless=True)
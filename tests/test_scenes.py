@@ -0,0 +1,90 @@
+"""Escenas y temporizadores: pasos de lógica, pausas y partidas seguidas sin recursión."""
+import sys
+
+import pygame
+
+from scenes import Scene, Scheduler
+
+
+def make_scheduler(fps=50, max_steps=5):
+    """Scheduler con escenas vacías "start", "play" y "goal" que apunta sus entradas."""
+    scheduler = Scheduler(fps, max_steps=max_steps)
+    scheduler.entered = []
+    for name in ("start", "play", "goal"):
+        scheduler.add(name, Scene(enter=lambda name=name: scheduler.entered.append(name)))
+    scheduler.switch("start")
+    return scheduler
+
+
+def test_after_fires_on_its_step():
+    scheduler = make_scheduler()  # 20 ms por paso
+    fired = []
+    scheduler.after(60, lambda: fired.append(scheduler.steps))
+    for _ in range(5):
+        scheduler.tick(20, [])
+    assert fired == [3]
+
+
+def test_pause_returns_to_previous_scene():
+    scheduler = make_scheduler()
+    scheduler.switch("play")
+    scheduler.pause("goal", 100)
+    assert scheduler.name == "goal"
+    scheduler.tick(80, [])
+    assert scheduler.name == "goal"
+    scheduler.tick(20, [])
+    assert scheduler.name == "play"
+    assert scheduler.entered == ["start", "play", "goal", "play"]
+
+
+def test_switch_cancels_pending_timers():
+    scheduler = make_scheduler()
+    fired = []
+    scheduler.after(20, lambda: fired.append("start"))
+    scheduler.switch("play")
+    scheduler.tick(100, [])
+    assert fired == []
+    assert not scheduler.timers
+
+
+def test_tick_runs_whole_steps_and_keeps_the_rest():
+    scheduler = make_scheduler()
+    updates = []
+    scheduler.scenes["start"].update = lambda: updates.append(scheduler.steps)
+    assert scheduler.tick(50, []) == 2  # 50 ms = 2 pasos de 20 y sobran 10
+    assert scheduler.tick(10, []) == 1
+    assert scheduler.tick(19, []) == 0
+    assert updates == [1, 2, 3]
+
+
+def test_tick_drops_time_above_max_steps():
+    scheduler = make_scheduler(max_steps=5)
+    assert scheduler.tick(1000, []) == 5  # Un parón largo: no se recupera todo de golpe
+    assert scheduler.accumulator == 0.0
+    assert scheduler.tick(10, []) == 0
+
+
+def test_matches_in_a_row_keep_the_stack_flat(pong):
+    game = pong.Pong(seed=1, history=False)
+    game.winning_score = 1
+    game.winner_pause = 100
+    scheduler = game.scheduler
+    depths = []
+    show_start_screen = scheduler.scenes["start"].enter
+
+    def enter_start():
+        frame, depth = sys._getframe(), 0
+        while frame is not None:
+            frame, depth = frame.f_back, depth + 1
+        depths.append(depth)
+        show_start_screen()
+
+    scheduler.scenes["start"].enter = enter_start
+    scheduler.switch("start")
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(0, 0), button=1)
+    while len(depths) < 30:
+        scheduler.tick(scheduler.step_ms, [click] if scheduler.name == "start" else [])
+
+    # La primera entrada viene de switch(); todas las demás, del temporizador y a la misma profundidad
+    assert len(set(depths[1:])) == 1
+    assert len(scheduler.timers) <= 1